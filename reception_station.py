@@ -1,24 +1,48 @@
 import sys
+import asyncio
+from contextlib import contextmanager
 import socketio
+import qasync
 from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QPushButton, QVBoxLayout
-from PyQt5.QtCore import Qt, pyqtSignal, QObject
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QFont, QColor, QPalette
 
-class ReceptionSignals(QObject):
-    unlock = pyqtSignal()
-    show_abort = pyqtSignal()
-    abort_success = pyqtSignal()
-    full_reset = pyqtSignal()
+RED = QColor('#ff0000')
+GREEN = QColor('#00ff00')
+AMBER = QColor('#ffaa00')
+
+ABORT_BUTTON_QSS = """
+    QPushButton {
+        background-color: #ff0000;
+        color: white;
+        font-size: 60px;
+        font-weight: bold;
+        padding: 50px;
+        border: 5px solid #fff;
+        border-radius: 20px;
+    }
+    QPushButton:hover {
+        background-color: #cc0000;
+    }
+    QPushButton:pressed {
+        background-color: #990000;
+    }
+"""
+
+_fonts = {}
+
+def courier_font(size, weight=-1):
+    """Return a shared Courier New QFont (call only once a QApplication exists)"""
+    key = (size, weight)
+    if key not in _fonts:
+        _fonts[key] = QFont('Courier New', size, weight)
+    return _fonts[key]
 
 class ReceptionStation(QWidget):
     def __init__(self, server_url):
         super().__init__()
-        self.signals = ReceptionSignals()
-        self.signals.unlock.connect(self.unlock_screen)
-        self.signals.show_abort.connect(self.show_abort_button)
-        self.signals.abort_success.connect(self.show_success)
-        self.signals.full_reset.connect(self.reset_to_locked)
-        
+        self.sio = None
+        self.has_connected = False
         self.initUI()
         self.setup_socketio(server_url)
     
@@ -33,38 +57,20 @@ class ReceptionStation(QWidget):
         # Locked message
         self.locked_label = QLabel('🔒 SYSTEM LOCKED 🔒', self)
         self.locked_label.setAlignment(Qt.AlignCenter)
-        self.locked_label.setStyleSheet("color: #ff0000;")
-        font = QFont('Courier New', 80, QFont.Bold)
-        self.locked_label.setFont(font)
+        self.set_text_color(self.locked_label, RED)
+        self.locked_label.setFont(courier_font(80, QFont.Bold))
         layout.addWidget(self.locked_label)
         
         self.message_label = QLabel('ACCESS DENIED', self)
         self.message_label.setAlignment(Qt.AlignCenter)
-        self.message_label.setStyleSheet("color: #ff0000;")
+        self.set_text_color(self.message_label, RED)
         self.message_label.setWordWrap(True)
-        msg_font = QFont('Courier New', 40)
-        self.message_label.setFont(msg_font)
+        self.message_label.setFont(courier_font(40))
         layout.addWidget(self.message_label)
         
         # Abort button (hidden initially)
         self.abort_button = QPushButton('ABORT SELF-DESTRUCT', self)
-        self.abort_button.setStyleSheet("""
-            QPushButton {
-                background-color: #ff0000;
-                color: white;
-                font-size: 60px;
-                font-weight: bold;
-                padding: 50px;
-                border: 5px solid #fff;
-                border-radius: 20px;
-            }
-            QPushButton:hover {
-                background-color: #cc0000;
-            }
-            QPushButton:pressed {
-                background-color: #990000;
-            }
-        """)
+        self.abort_button.setStyleSheet(ABORT_BUTTON_QSS)
         self.abort_button.clicked.connect(self.press_abort_button)
         self.abort_button.hide()
         layout.addWidget(self.abort_button)
@@ -72,98 +78,137 @@ class ReceptionStation(QWidget):
         self.setLayout(layout)
     
     def setup_socketio(self, server_url):
-        self.sio = socketio.Client(logger=False, engineio_logger=False,
+        # AsyncClient runs on the Qt loop via qasync, so handlers touch widgets directly
+        self.sio = socketio.AsyncClient(logger=False, engineio_logger=False,
             reconnection=True, reconnection_attempts=0,
             reconnection_delay=1, reconnection_delay_max=5)
         
         @self.sio.event
-        def connect():
+        async def connect():
             print('Reception station connected')
+            if not self.has_connected:
+                self.has_connected = True
+                self.message_label.setText('ACCESS DENIED')
         
         @self.sio.event
-        def disconnect():
+        async def connect_error(data):
+            print(f"Connection error: {data}")
+            # Only the boot-time attempts are shown; later drops keep the game screen
+            if not self.has_connected:
+                self.message_label.setText(f'CONNECTION FAILED\n{data}')
+        
+        @self.sio.event
+        async def disconnect():
             print('Reception station disconnected')
         
         @self.sio.on('game_over')
-        def on_game_over(data):
-            self.signals.unlock.emit()
+        async def on_game_over(data):
+            self.unlock_screen()
         
         @self.sio.on('transmission_shutdown')
-        def on_transmission_shutdown(data):
+        async def on_transmission_shutdown(data):
             if data.get('success'):
-                self.signals.show_abort.emit()
+                self.show_abort_button()
         
         @self.sio.on('self_destruct_aborted')
-        def on_aborted(data):
-            self.signals.abort_success.emit()
+        async def on_aborted(data):
+            self.show_success()
         
         @self.sio.on('game_reset')
-        def on_reset(data):
-            self.signals.full_reset.emit()
+        async def on_reset(data):
+            self.reset_to_locked()
         
         @self.sio.on('timer_stopped')
-        def on_stopped(data):
-            self.signals.full_reset.emit()
+        async def on_stopped(data):
+            self.reset_to_locked()
         
         @self.sio.on('abort_failed_full_reset')
-        def on_abort_failed_full_reset(data):
-            self.signals.full_reset.emit()
+        async def on_abort_failed_full_reset(data):
+            self.reset_to_locked()
         
+        # Connect once the window has been shown instead of blocking startup
+        QTimer.singleShot(100, lambda: asyncio.ensure_future(self.try_connect(server_url)))
+    
+    async def try_connect(self, server_url):
+        """Connect to the server, retrying until it is up; connect_error reports failures"""
+        print(f"Connecting to {server_url}...")
+        # retry=True keeps trying with socketio's backoff even if the server is down at boot
         try:
-            print(f"Connecting to {server_url}...")
-            self.sio.connect(server_url, namespaces=['/'])
-            print("Connected successfully!")
+            await self.sio.connect(server_url, namespaces=['/'], transports=['websocket'], retry=True)
         except Exception as e:
             print(f"Connection error: {e}")
             self.message_label.setText(f'CONNECTION FAILED\n{str(e)}')
     
+    def set_text_color(self, label, color):
+        """Recolor a label through its palette rather than re-parsing a stylesheet"""
+        pal = label.palette()
+        pal.setColor(QPalette.WindowText, color)
+        label.setPalette(pal)
+    
+    @contextmanager
+    def batched_updates(self):
+        """Suspend repaints while a state transition changes several widgets"""
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+    
     def unlock_screen(self):
-        self.locked_label.setText('⏰ TIME EXPIRED ⏰')
-        self.locked_label.setStyleSheet("color: #ff0000;")
-        self.message_label.setText('PLEASE PRESS THE BUTTON ON THE WALL\nNEXT TO THE EXIT TO LEAVE THE ESCAPE ROOM')
-        self.message_label.setStyleSheet("color: #ffaa00;")
-        self.abort_button.hide()
+        with self.batched_updates():
+            self.locked_label.setText('⏰ TIME EXPIRED ⏰')
+            self.set_text_color(self.locked_label, RED)
+            self.message_label.setText('PLEASE PRESS THE BUTTON ON THE WALL\nNEXT TO THE EXIT TO LEAVE THE ESCAPE ROOM')
+            self.set_text_color(self.message_label, AMBER)
+            self.abort_button.hide()
     
     def show_abort_button(self):
-        self.locked_label.setText('⚠️ SELF-DESTRUCT ACTIVE ⚠️')
-        self.locked_label.setStyleSheet("color: #ff0000;")
-        self.message_label.setText('PRESS BUTTON TO ABORT\nI GET BY WITH A LITTLE HELP FROM MY FRIENDS')
-        self.message_label.setStyleSheet("color: #ffaa00;")
-        self.abort_button.show()
+        with self.batched_updates():
+            self.locked_label.setText('⚠️ SELF-DESTRUCT ACTIVE ⚠️')
+            self.set_text_color(self.locked_label, RED)
+            self.message_label.setText('PRESS BUTTON TO ABORT\nI GET BY WITH A LITTLE HELP FROM MY FRIENDS')
+            self.set_text_color(self.message_label, AMBER)
+            self.abort_button.show()
     
     def press_abort_button(self):
         print("Reception abort button pressed!")
-        self.sio.emit('abort_button_press', {'location': 'reception'})
+        asyncio.ensure_future(self.sio.emit('abort_button_press', {'location': 'reception'}))
         self.abort_button.setEnabled(False)
         self.message_label.setText('BUTTON PRESSED!\nWAITING FOR SERVER ROOM...')
     
     def show_success(self):
-        self.locked_label.setText('✓ MISSION COMPLETE ✓')
-        self.locked_label.setStyleSheet("color: #00ff00;")
-        self.message_label.setText('PLEASE PRESS THE BUTTON ON THE WALL\nNEXT TO THE EXIT TO LEAVE THE ESCAPE ROOM')
-        self.message_label.setStyleSheet("color: #00ff00;")
-        self.abort_button.hide()
+        with self.batched_updates():
+            self.locked_label.setText('✓ MISSION COMPLETE ✓')
+            self.set_text_color(self.locked_label, GREEN)
+            self.message_label.setText('PLEASE PRESS THE BUTTON ON THE WALL\nNEXT TO THE EXIT TO LEAVE THE ESCAPE ROOM')
+            self.set_text_color(self.message_label, GREEN)
+            self.abort_button.hide()
     
     def reset_to_locked(self):
-        self.locked_label.setText('🔒 SYSTEM LOCKED 🔒')
-        self.locked_label.setStyleSheet("color: #ff0000;")
-        self.message_label.setText('ACCESS DENIED')
-        self.message_label.setStyleSheet("color: #ff0000;")
-        self.abort_button.hide()
-        self.abort_button.setEnabled(True)
+        with self.batched_updates():
+            self.locked_label.setText('🔒 SYSTEM LOCKED 🔒')
+            self.set_text_color(self.locked_label, RED)
+            self.message_label.setText('ACCESS DENIED')
+            self.set_text_color(self.message_label, RED)
+            self.abort_button.hide()
+            self.abort_button.setEnabled(True)
     
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Escape:
             self.close()
     
     def closeEvent(self, event):
-        if hasattr(self, 'sio') and self.sio.connected:
-            self.sio.disconnect()
+        if self.sio is not None and self.sio.connected:
+            asyncio.ensure_future(self.sio.disconnect())
         event.accept()
 
 if __name__ == '__main__':
     SERVER_URL = 'http://10.0.0.167:5000'  # DM Mac IP
     
     app = QApplication(sys.argv)
+    loop = qasync.QEventLoop(app)
+    asyncio.set_event_loop(loop)
     station = ReceptionStation(SERVER_URL)
-    sys.exit(app.exec_())
\ No newline at end of file
+    with loop:
+        loop.run_forever()
\ No newline at end of file
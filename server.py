@@ -1,44 +1,72 @@
+import eventlet
+eventlet.monkey_patch()
+
 from flask import Flask, render_template, request
 from flask_socketio import SocketIO, emit
 from flask_cors import CORS
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field
+from typing import Optional
 import time
+import operator
+import hmac
+import atexit
+import logging
+import logging.handlers
+import queue
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'escape_room_secret_2024'
 CORS(app)
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading', 
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode='eventlet', 
     ping_timeout=60, ping_interval=25)
 
+# Logging is formatted and written off the handler threads by a QueueListener
+log_queue = queue.Queue(-1)
+logger = logging.getLogger('escape')
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.handlers.QueueHandler(log_queue))
+log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+log_listener.start()
+# Flush whatever is still queued when the process exits
+atexit.register(log_listener.stop)
+
 # Game state
-game_state = {
-    'timer_running': False,
-    'time_remaining': 1800,  # 30 minutes in seconds
-    'start_time': None,
-    'reception_unlocked': False,
-    'transmission_shut_down': False,
-    'self_destruct_active': False,
-    'self_destruct_aborted': False,
-    'abort_buttons': {
+@dataclass(slots=True)
+class GameState:
+    timer_running: bool = False
+    time_remaining: int = 1800  # 30 minutes in seconds
+    start_time: Optional[float] = None  # monotonic time the game was started
+    reception_unlocked: bool = False
+    transmission_shut_down: bool = False
+    self_destruct_active: bool = False
+    self_destruct_aborted: bool = False
+    deadline: Optional[float] = None  # monotonic time at which the countdown hits zero
+    timer_task_running: bool = False
+    last_emit_ts: float = 0.0  # monotonic time of the last timer_update emit
+    abort_buttons: dict = field(default_factory=lambda: {
         'reception': None,
         'server_room': None
-    }
-}
+    })
+
+game_state = GameState()
 
 # Codes
 TRANSMISSION_CODE = "4815162342"
 ABORT_WINDOW_SECONDS = 10
+TIMER_UPDATE_MIN_INTERVAL = 0.5  # well under the 1s tick, so a late tick never drops the next one
+
+# Fixed emit payloads, built once. Treat as read-only: they are shared by every emit.
+AUDIO_START = {'clip': 'start'}
+AUDIO_ALARM = {'clip': 'alarm'}
+GAMEOVER_FAIL = {'success': False}
+
+_STATE_KEYS = ('timer_running', 'time_remaining', 'reception_unlocked',
+    'transmission_shut_down', 'self_destruct_active', 'self_destruct_aborted')
+_state_values = operator.attrgetter(*_STATE_KEYS)
 
 def get_serializable_state():
     """Return a JSON-serializable version of game_state"""
-    return {
-        'timer_running': game_state['timer_running'],
-        'time_remaining': game_state['time_remaining'],
-        'reception_unlocked': game_state['reception_unlocked'],
-        'transmission_shut_down': game_state['transmission_shut_down'],
-        'self_destruct_active': game_state['self_destruct_active'],
-        'self_destruct_aborted': game_state['self_destruct_aborted']
-    }
+    return dict(zip(_STATE_KEYS, _state_values(game_state)))
 
 @app.route('/')
 def index():
@@ -46,86 +74,108 @@ def index():
 
 @socketio.on('connect')
 def handle_connect():
-    print(f'Client connected: {request.sid}')
+    logger.info('Client connected: %s', request.sid)
     emit('game_state', get_serializable_state())
 
 @socketio.on('start_timer')
 def handle_start_timer():
     """Start the 30-minute countdown"""
-    game_state['timer_running'] = True
-    game_state['start_time'] = datetime.now()
-    game_state['time_remaining'] = 1800
-    game_state['reception_unlocked'] = False
-    game_state['transmission_shut_down'] = False
-    game_state['self_destruct_active'] = False
-    game_state['self_destruct_aborted'] = False
-    game_state['abort_buttons'] = {'reception': None, 'server_room': None}
+    game_state.timer_running = True
+    game_state.start_time = time.monotonic()
+    game_state.time_remaining = 1800
+    game_state.deadline = time.monotonic() + 1800
+    game_state.reception_unlocked = False
+    game_state.transmission_shut_down = False
+    game_state.self_destruct_active = False
+    game_state.self_destruct_aborted = False
+    game_state.abort_buttons.update(reception=None, server_room=None)
     
-    print("Timer started!")
+    logger.info("Timer started!")
     
-    # Start countdown loop
-    socketio.start_background_task(countdown_timer)
+    # Start countdown loop (a still-running task picks up the new deadline)
+    if not game_state.timer_task_running:
+        game_state.timer_task_running = True
+        socketio.start_background_task(countdown_timer)
     
     # Emit to all clients
     socketio.emit('timer_started', get_serializable_state(), namespace='/')
-    socketio.emit('play_audio', {'clip': 'start'}, namespace='/')
+    socketio.emit('play_audio', AUDIO_START, namespace='/')
 
 def countdown_timer():
-    """Background task to update timer every second"""
-    while game_state['timer_running'] and game_state['time_remaining'] > 0:
-        time.sleep(1)
-        game_state['time_remaining'] -= 1
-        socketio.emit('timer_update', {
-            'time_remaining': game_state['time_remaining']
-        }, namespace='/')
-    
-    if game_state['time_remaining'] <= 0:
-        game_state['timer_running'] = False
-        game_state['reception_unlocked'] = True
-        socketio.emit('game_over', {'success': False}, namespace='/')
+    """Background task to update timer against a monotonic deadline so ticks don't drift"""
+    try:
+        next_tick = time.monotonic() + 1.0
+        while game_state.timer_running and game_state.time_remaining > 0:
+            socketio.sleep(max(0, next_tick - time.monotonic()))
+            next_tick += 1.0
+            if not game_state.timer_running:
+                break
+            new_remaining = max(0, int(round(game_state.deadline - time.monotonic())))
+            if new_remaining != game_state.time_remaining:
+                game_state.time_remaining = new_remaining
+                logger.debug("Tick: %d seconds remaining", new_remaining)
+                # Coalesce bursts (e.g. pause/resume churn), but send every second near the end
+                now = time.monotonic()
+                if now - game_state.last_emit_ts >= TIMER_UPDATE_MIN_INTERVAL or new_remaining <= 10:
+                    game_state.last_emit_ts = now
+                    socketio.emit('timer_update', {
+                        'time_remaining': game_state.time_remaining
+                    }, namespace='/')
+        
+        if game_state.time_remaining <= 0:
+            game_state.timer_running = False
+            game_state.reception_unlocked = True
+            socketio.emit('game_over', GAMEOVER_FAIL, namespace='/')
+    finally:
+        game_state.timer_task_running = False
 
 @socketio.on('pause_timer')
 def handle_pause_timer():
     """Pause the timer (can be resumed)"""
-    if game_state['timer_running']:
-        game_state['timer_running'] = False
-        print(f"Timer paused at {game_state['time_remaining']} seconds")
+    if game_state.timer_running:
+        game_state.timer_running = False
+        logger.info("Timer paused at %d seconds", game_state.time_remaining)
         socketio.emit('timer_paused', get_serializable_state(), namespace='/')
 
 @socketio.on('resume_timer')
 def handle_resume_timer():
     """Resume the timer from where it was paused"""
-    if not game_state['timer_running'] and game_state['time_remaining'] > 0:
-        game_state['timer_running'] = True
-        print(f"Timer resumed at {game_state['time_remaining']} seconds")
-        socketio.start_background_task(countdown_timer)
+    if not game_state.timer_running and game_state.time_remaining > 0:
+        game_state.timer_running = True
+        game_state.deadline = time.monotonic() + game_state.time_remaining
+        logger.info("Timer resumed at %d seconds", game_state.time_remaining)
+        if not game_state.timer_task_running:
+            game_state.timer_task_running = True
+            socketio.start_background_task(countdown_timer)
         socketio.emit('timer_resumed', get_serializable_state(), namespace='/')
 
 @socketio.on('stop_timer')
 def handle_stop_timer():
     """Emergency stop and complete reset"""
-    game_state['timer_running'] = False
-    game_state['time_remaining'] = 1800
-    game_state['reception_unlocked'] = False
-    game_state['transmission_shut_down'] = False
-    game_state['self_destruct_active'] = False
-    game_state['self_destruct_aborted'] = False
-    game_state['abort_buttons'] = {'reception': None, 'server_room': None}
-    print("Timer stopped and reset!")
+    game_state.timer_running = False
+    game_state.time_remaining = 1800
+    game_state.deadline = None
+    game_state.reception_unlocked = False
+    game_state.transmission_shut_down = False
+    game_state.self_destruct_active = False
+    game_state.self_destruct_aborted = False
+    game_state.abort_buttons.update(reception=None, server_room=None)
+    logger.info("Timer stopped and reset!")
     socketio.emit('timer_stopped', get_serializable_state(), namespace='/')
 
 @socketio.on('reset_game')
 def handle_reset_game():
     """Reset everything"""
-    game_state['timer_running'] = False
-    game_state['time_remaining'] = 1800
-    game_state['start_time'] = None
-    game_state['reception_unlocked'] = False
-    game_state['transmission_shut_down'] = False
-    game_state['self_destruct_active'] = False
-    game_state['self_destruct_aborted'] = False
-    game_state['abort_buttons'] = {'reception': None, 'server_room': None}
-    print("Game reset!")
+    game_state.timer_running = False
+    game_state.time_remaining = 1800
+    game_state.start_time = None
+    game_state.deadline = None
+    game_state.reception_unlocked = False
+    game_state.transmission_shut_down = False
+    game_state.self_destruct_active = False
+    game_state.self_destruct_aborted = False
+    game_state.abort_buttons.update(reception=None, server_room=None)
+    logger.info("Game reset!")
     socketio.emit('game_reset', get_serializable_state(), namespace='/')
 
 @socketio.on('check_transmission_code')
@@ -133,20 +183,25 @@ def handle_transmission_code(data):
     """Check if transmission code is correct"""
     code = data.get('code', '')
     
-    print(f"Code received: {code}")
+    logger.info("Code received: %s", code)
     
     # Send verifying message first
     emit('transmission_verifying', {'code': code})
     
+    # Finish verification in the background so this handler returns immediately
+    socketio.start_background_task(finish_code_check, code, request.sid)
+
+def finish_code_check(code, sid):
+    """Background task to apply the verification delay and report the result"""
     # Simulate verification delay (2 seconds)
-    time.sleep(2)
+    socketio.sleep(2)
     
-    if code == TRANSMISSION_CODE:
-        game_state['transmission_shut_down'] = True
-        game_state['self_destruct_active'] = True
-        game_state['abort_buttons'] = {'reception': None, 'server_room': None}
+    if hmac.compare_digest(str(code).encode(), TRANSMISSION_CODE.encode()):
+        game_state.transmission_shut_down = True
+        game_state.self_destruct_active = True
+        game_state.abort_buttons.update(reception=None, server_room=None)
         
-        print("✓ Correct code! Self-destruct initiated!")
+        logger.info("✓ Correct code! Self-destruct initiated!")
         
         # Emit to all clients
         socketio.emit('transmission_shutdown', {
@@ -155,58 +210,60 @@ def handle_transmission_code(data):
         }, namespace='/')
         
         # Trigger audio
-        socketio.emit('play_audio', {'clip': 'alarm'}, namespace='/')
+        socketio.emit('play_audio', AUDIO_ALARM, namespace='/')
         
     else:
-        print("✗ Invalid code")
-        emit('transmission_shutdown', {'success': False, 'message': 'INVALID CODE - ACCESS DENIED'})
+        logger.info("✗ Invalid code")
+        socketio.emit('transmission_shutdown', {'success': False, 'message': 'INVALID CODE - ACCESS DENIED'},
+            to=sid, namespace='/')
 
 @socketio.on('abort_button_press')
 def handle_abort_button(data):
     """Handle abort button press from either laptop"""
     location = data.get('location')
-    current_time = datetime.now()
+    current_time = time.monotonic()
     
-    if not game_state['self_destruct_active'] or game_state['self_destruct_aborted']:
+    if not game_state.self_destruct_active or game_state.self_destruct_aborted:
         return
     
-    print(f"Abort button pressed at {location}")
+    logger.info("Abort button pressed at %s", location)
     
     # Record this button press
-    game_state['abort_buttons'][location] = current_time
+    buttons = game_state.abort_buttons
+    buttons[location] = current_time
     
-    # Check if both buttons have been pressed
-    reception_time = game_state['abort_buttons']['reception']
-    server_time = game_state['abort_buttons']['server_room']
+    # Check if both buttons have been pressed (0.0 is a valid monotonic timestamp)
+    reception_time = buttons['reception']
+    server_time = buttons['server_room']
     
-    if reception_time and server_time:
+    if reception_time is not None and server_time is not None:
         # Calculate time difference
-        time_diff = abs((reception_time - server_time).total_seconds())
+        time_diff = abs(reception_time - server_time)
         
         if time_diff <= ABORT_WINDOW_SECONDS:
             # SUCCESS!
-            game_state['self_destruct_aborted'] = True
-            game_state['self_destruct_active'] = False
-            game_state['timer_running'] = False
-            game_state['reception_unlocked'] = True
+            game_state.self_destruct_aborted = True
+            game_state.self_destruct_active = False
+            game_state.timer_running = False
+            game_state.reception_unlocked = True
             
             socketio.emit('self_destruct_aborted', {
                 'success': True,
                 'time_diff': round(time_diff, 2)
             }, namespace='/')
             
-            print(f"✓ Self-destruct aborted! Time difference: {time_diff:.2f} seconds")
+            logger.info("✓ Self-destruct aborted! Time difference: %.2f seconds", time_diff)
         else:
             # Too far apart - FULL RESET back to beginning
-            game_state['abort_buttons'] = {'reception': None, 'server_room': None}
-            game_state['self_destruct_active'] = False
-            game_state['transmission_shut_down'] = False
+            game_state.abort_buttons.update(reception=None, server_room=None)
+            game_state.self_destruct_active = False
+            game_state.transmission_shut_down = False
             
             socketio.emit('abort_failed_full_reset', {
                 'reason': 'not_simultaneous',
                 'time_diff': round(time_diff, 2)
             }, namespace='/')
-            print(f"✗ Abort failed - buttons pressed {time_diff:.2f} seconds apart - FULL RESET")
+            logger.info("✗ Abort failed - buttons pressed %.2f seconds apart - FULL RESET", time_diff)
     else:
         # First button pressed
         socketio.emit('abort_button_pressed', {
@@ -222,7 +279,7 @@ def handle_trigger_audio(data):
 
 @socketio.on('disconnect')
 def handle_disconnect():
-    print(f'Client disconnected: {request.sid}')
+    logger.info('Client disconnected: %s', request.sid)
 
 if __name__ == '__main__':
     print("=" * 50)
@@ -1,38 +1,94 @@
 import sys
+import asyncio
 import socketio
+import qasync
+import orjson
 import pygame
 import os
 import random
-from threading import Thread, Event
+import atexit
+import logging
+import logging.handlers
+import queue
+from threading import Lock
 from PyQt5.QtWidgets import QApplication, QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout
-from PyQt5.QtCore import Qt, pyqtSignal, QObject, QTimer
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QObject, QTimer, QThreadPool, QRunnable, QMetaObject
 from PyQt5.QtGui import QFont
 
+# Logging is written by a QueueListener thread so socket handlers never block on stdout
+log_queue = queue.Queue(-1)
+logger = logging.getLogger('escape.server_room')
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.handlers.QueueHandler(log_queue))
+log_listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+log_listener.start()
+atexit.register(log_listener.stop)  # drain records logged while the window closes
+
+# Stylesheets shared by every state change, so each one is a single string object
+STYLE_GREEN_LABEL = "color: #00ff00;"
+STYLE_RED_LABEL = "color: #ff0000;"
+STYLE_ORANGE_LABEL = "color: #ffaa00;"
+STYLE_CONN_LABEL = """
+    QLabel {
+        font-size: 16px;
+        background-color: rgba(0, 0, 0, 0.7);
+        padding: 5px 10px;
+        border-radius: 5px;
+    }
+    QLabel[conn="up"] {
+        color: #00ff00;
+        border: 1px solid #00ff00;
+    }
+    QLabel[conn="down"] {
+        color: #ff0000;
+        border: 1px solid #ff0000;
+    }
+"""
+
+AUDIO_EXTENSIONS = ['.mp3', '.wav', '.ogg']
+
+# Clips played by the random scheduler or the DM, decoded on first play and kept as Sounds
+PRELOADED_CLIPS = ['creepy1', 'creepy2', 'whisper', 'footsteps', 'door_creak', 'alarm']
+
+class OrjsonCodec:
+    """json-module stand-in so socketio encodes and decodes packets with orjson"""
+    @staticmethod
+    def dumps(obj, **kwargs):
+        # orjson always emits compact separators, which is what socketio asks for
+        return orjson.dumps(obj).decode()
+    
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+class Evt:
+    """Event ids carried by ServerSignals.event (payload-less events use invoke_queued)"""
+    TRANSMISSION_FAILED = 0  # payload: message
+    PLAY_AUDIO = 1  # payload: clip name
+    CONNECTION_STATUS = 2  # payload: True = connected, False = disconnected
+    WARMUP = 3  # emitted once at startup; ignored
+
 class ServerSignals(QObject):
-    transmission_verifying = pyqtSignal()
-    transmission_success = pyqtSignal()
-    transmission_failed = pyqtSignal(str)
-    show_abort = pyqtSignal()
-    abort_success = pyqtSignal()
-    abort_reset = pyqtSignal()
-    play_audio = pyqtSignal(str)
-    game_reset = pyqtSignal()
-    connection_status = pyqtSignal(bool)  # True = connected, False = disconnected
+    event = pyqtSignal(int, object)  # (Evt id, payload)
 
 class ServerRoomStation(QWidget):
+    CREEPY_SOUNDS = ('creepy1', 'creepy2', 'whisper', 'footsteps', 'door_creak')
+    
     def __init__(self, server_url):
         super().__init__()
         self.server_url = server_url
         self.signals = ServerSignals()
-        self.signals.transmission_verifying.connect(self.show_verifying)
-        self.signals.transmission_success.connect(self.show_self_destruct)
-        self.signals.transmission_failed.connect(self.show_failure)
-        self.signals.show_abort.connect(self.show_abort_button)
-        self.signals.abort_success.connect(self.show_success)
-        self.signals.abort_reset.connect(self.reset_abort_button)
-        self.signals.play_audio.connect(self.play_sound)
-        self.signals.game_reset.connect(self.reset_station)
-        self.signals.connection_status.connect(self.update_connection_status)
+        self.event_handlers = {
+            Evt.TRANSMISSION_FAILED: self.show_failure,
+            Evt.PLAY_AUDIO: self.play_sound_async,
+            Evt.CONNECTION_STATUS: self.update_connection_status,
+            Evt.WARMUP: lambda payload: None,
+        }
+        # Queued like invoke_queued, so payload and payload-less events run in arrival order
+        self.signals.event.connect(self.handle_event, Qt.QueuedConnection)
+        # Push one no-op through each queued path so the first player action is not the slow one
+        self.signals.event.emit(Evt.WARMUP, None)
+        self.invoke_queued('warm_up')
         
         self.init_audio()
         self.initUI()
@@ -42,21 +98,30 @@ class ServerRoomStation(QWidget):
         self.reset_timer.setSingleShot(True)
         self.reset_timer.timeout.connect(self.reset_input)
         
-        # Reconnection timer
-        self.reconnect_timer = QTimer(self)
-        self.reconnect_timer.timeout.connect(self.attempt_reconnect)
-        
         self.setup_socketio(server_url)
         self.start_random_sounds()
     
     def init_audio(self):
-        """Initialize pygame mixer for audio"""
-        pygame.mixer.init()
+        """Locate audio files; the pygame mixer is started on first playback"""
+        self.mixer_ready = False
+        self.mixer_lock = Lock()
+        self.sounds = {}
+        self.audio_pool = QThreadPool.globalInstance()
         script_dir = os.path.dirname(os.path.abspath(__file__))
         self.audio_path = os.path.join(script_dir, 'audio')
         if not os.path.exists(self.audio_path):
             os.makedirs(self.audio_path)
-        self.stop_sounds = Event()
+        
+        # Map clip name -> file once, preferring extensions in AUDIO_EXTENSIONS order
+        self.clip_paths = {}
+        with os.scandir(self.audio_path) as entries:
+            files = {entry.name: entry.path for entry in entries if entry.is_file()}
+        for ext in AUDIO_EXTENSIONS:
+            for name, path in files.items():
+                stem, file_ext = os.path.splitext(name)
+                if file_ext == ext:
+                    self.clip_paths.setdefault(stem, path)
+        self.sounds_stopped = False
     
     def initUI(self):
         self.setWindowTitle('Server Room Terminal')
@@ -68,21 +133,15 @@ class ServerRoomStation(QWidget):
         
         # Connection status indicator (small, top corner)
         self.connection_label = QLabel('● CONNECTED', self)
-        self.connection_label.setStyleSheet("""
-            color: #00ff00;
-            font-size: 16px;
-            background-color: rgba(0, 0, 0, 0.7);
-            padding: 5px 10px;
-            border: 1px solid #00ff00;
-            border-radius: 5px;
-        """)
+        self.connection_label.setProperty('conn', 'up')
+        self.connection_label.setStyleSheet(STYLE_CONN_LABEL)
         self.connection_label.setFixedSize(180, 30)
         self.connection_label.move(20, 20)  # Top-left corner
         
         # Title
         self.title_label = QLabel('SERVER CONTROL TERMINAL', self)
         self.title_label.setAlignment(Qt.AlignCenter)
-        self.title_label.setStyleSheet("color: #00ff00;")
+        self.apply_style(self.title_label, STYLE_GREEN_LABEL)
         title_font = QFont('Courier New', 50, QFont.Bold)
         self.title_label.setFont(title_font)
         layout.addWidget(self.title_label)
@@ -90,7 +149,7 @@ class ServerRoomStation(QWidget):
         # Instructions
         self.instruction_label = QLabel('ENTER SHUTDOWN CODE:', self)
         self.instruction_label.setAlignment(Qt.AlignCenter)
-        self.instruction_label.setStyleSheet("color: #00ff00;")
+        self.apply_style(self.instruction_label, STYLE_GREEN_LABEL)
         inst_font = QFont('Courier New', 30)
         self.instruction_label.setFont(inst_font)
         layout.addWidget(self.instruction_label)
@@ -136,7 +195,7 @@ class ServerRoomStation(QWidget):
         # Status message
         self.status_label = QLabel('', self)
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("color: #ffaa00;")
+        self.apply_style(self.status_label, STYLE_ORANGE_LABEL)
         self.status_label.setWordWrap(True)
         status_font = QFont('Courier New', 25)
         self.status_label.setFont(status_font)
@@ -168,101 +227,95 @@ class ServerRoomStation(QWidget):
         self.setLayout(layout)
     
     def setup_socketio(self, server_url):
-        self.sio = socketio.Client(logger=False, engineio_logger=False,
+        # AsyncClient shares the Qt loop via qasync, so there is no socketio thread
+        self.sio = socketio.AsyncClient(logger=False, engineio_logger=False,
             reconnection=True, reconnection_attempts=0,
-            reconnection_delay=1, reconnection_delay_max=5)
+            reconnection_delay=1, reconnection_delay_max=5, json=OrjsonCodec)
         
         @self.sio.on('connect')
-        def on_connect():
-            print('✓ Server room station connected')
-            self.signals.connection_status.emit(True)
-            self.reconnect_timer.stop()
+        async def on_connect():
+            logger.info('✓ Server room station connected')
+            self.signals.event.emit(Evt.CONNECTION_STATUS, True)
         
         @self.sio.on('disconnect')
-        def on_disconnect():
-            print('✗ Server room station disconnected')
-            self.signals.connection_status.emit(False)
-            # Start trying to reconnect every 3 seconds
-            if not self.reconnect_timer.isActive():
-                self.reconnect_timer.start(3000)
+        async def on_disconnect():
+            logger.info('✗ Server room station disconnected')
+            self.signals.event.emit(Evt.CONNECTION_STATUS, False)
         
         @self.sio.on('connect_error')
-        def on_connect_error(data):
-            print(f'Connection error: {data}')
-            self.signals.connection_status.emit(False)
+        async def on_connect_error(data):
+            logger.warning('Connection error: %s', data)
+            self.signals.event.emit(Evt.CONNECTION_STATUS, False)
         
         @self.sio.on('transmission_verifying')
-        def on_verifying(data):
-            self.signals.transmission_verifying.emit()
+        async def on_verifying(data):
+            self.invoke_queued('show_verifying')
         
         @self.sio.on('transmission_shutdown')
-        def on_transmission_shutdown(data):
+        async def on_transmission_shutdown(data):
             if data.get('success'):
-                self.signals.transmission_success.emit()
-                self.signals.show_abort.emit()
+                self.invoke_queued('show_self_destruct')
+                self.invoke_queued('show_abort_button')
             else:
                 message = data.get('message', 'INVALID CODE')
-                self.signals.transmission_failed.emit(message)
+                self.signals.event.emit(Evt.TRANSMISSION_FAILED, message)
         
         @self.sio.on('self_destruct_aborted')
-        def on_aborted(data):
-            self.signals.abort_success.emit()
+        async def on_aborted(data):
+            self.invoke_queued('show_success')
         
         @self.sio.on('game_reset')
-        def on_reset(data):
-            self.signals.game_reset.emit()
+        async def on_reset(data):
+            self.invoke_queued('reset_station')
         
         @self.sio.on('timer_stopped')
-        def on_stopped(data):
-            self.signals.game_reset.emit()
+        async def on_stopped(data):
+            self.invoke_queued('reset_station')
         
         @self.sio.on('abort_failed_full_reset')
-        def on_abort_failed_full_reset(data):
-            self.signals.game_reset.emit()
+        async def on_abort_failed_full_reset(data):
+            self.invoke_queued('reset_station')
         
         @self.sio.on('play_audio')
-        def on_play_audio(data):
+        async def on_play_audio(data):
             clip = data.get('clip')
-            self.signals.play_audio.emit(clip)
+            self.signals.event.emit(Evt.PLAY_AUDIO, clip)
         
+        asyncio.ensure_future(self.initial_connect(server_url))
+    
+    def invoke_queued(self, slot_name):
+        """Queue a payload-less @pyqtSlot on the GUI loop without a dedicated signal"""
+        QMetaObject.invokeMethod(self, slot_name, Qt.QueuedConnection)
+    
+    @pyqtSlot()
+    def warm_up(self):
+        """No-op target for the startup invoke_queued call"""
+    
+    def handle_event(self, event_id, payload):
+        """Route a ServerSignals.event to the matching UI method"""
+        self.event_handlers[event_id](payload)
+    
+    async def initial_connect(self, server_url):
+        """Make the first connection attempt without blocking the Qt loop"""
+        # retry=True hands a failed first attempt to socketio's own backoff loop
         try:
-            self.sio.connect(server_url)
+            await self.sio.connect(server_url, transports=['websocket'], retry=True)
         except Exception as e:
-            print(f"Initial connection error: {e}")
-            self.signals.connection_status.emit(False)
-            self.reconnect_timer.start(3000)
+            logger.warning("Initial connection error: %s", e)
+            self.signals.event.emit(Evt.CONNECTION_STATUS, False)
     
-    def attempt_reconnect(self):
-        """Try to reconnect to the server"""
-        if not self.sio.connected:
-            print("Attempting to reconnect...")
-            try:
-                self.sio.connect(self.server_url)
-            except Exception as e:
-                print(f"Reconnection failed: {e}")
+    def apply_style(self, widget, style):
+        """Set a shared stylesheet, skipping the re-polish when it is already applied"""
+        if widget.styleSheet() != style:
+            widget.setStyleSheet(style)
     
     def update_connection_status(self, connected):
         """Update the connection status indicator"""
-        if connected:
-            self.connection_label.setText('● CONNECTED')
-            self.connection_label.setStyleSheet("""
-                color: #00ff00;
-                font-size: 16px;
-                background-color: rgba(0, 0, 0, 0.7);
-                padding: 5px 10px;
-                border: 1px solid #00ff00;
-                border-radius: 5px;
-            """)
-        else:
-            self.connection_label.setText('● DISCONNECTED')
-            self.connection_label.setStyleSheet("""
-                color: #ff0000;
-                font-size: 16px;
-                background-color: rgba(0, 0, 0, 0.7);
-                padding: 5px 10px;
-                border: 1px solid #ff0000;
-                border-radius: 5px;
-            """)
+        # Only the 'conn' property changes; the stylesheet set in initUI picks the colors
+        self.connection_label.setProperty('conn', 'up' if connected else 'down')
+        self.connection_label.style().unpolish(self.connection_label)
+        self.connection_label.style().polish(self.connection_label)
+        self.connection_label.setText('● CONNECTED' if connected else '● DISCONNECTED')
     
     def submit_code(self):
         code = self.code_input.text()
@@ -272,27 +325,31 @@ class ServerRoomStation(QWidget):
         # Check if connected before submitting
         if not self.sio.connected:
             self.status_label.setText('ERROR: NOT CONNECTED TO SERVER')
-            self.status_label.setStyleSheet("color: #ff0000;")
+            self.apply_style(self.status_label, STYLE_RED_LABEL)
             return
         
-        print(f"Submitting code: {code}")
+        logger.info("Submitting code: %s", code)
+        self.code_input.setEnabled(False)
+        self.submit_button.setEnabled(False)
+        asyncio.ensure_future(self.send_code(code))
+    
+    async def send_code(self, code):
         try:
-            self.sio.emit('check_transmission_code', {'code': code})
-            self.code_input.setEnabled(False)
-            self.submit_button.setEnabled(False)
+            await self.sio.emit('check_transmission_code', {'code': code})
         except Exception as e:
-            print(f"Error submitting code: {e}")
+            logger.error("Error submitting code: %s", e)
             self.status_label.setText('ERROR: CONNECTION LOST')
-            self.status_label.setStyleSheet("color: #ff0000;")
+            self.apply_style(self.status_label, STYLE_RED_LABEL)
             self.reset_timer.start(3000)
     
+    @pyqtSlot()
     def show_verifying(self):
         self.status_label.setText('VERIFYING CODE...')
-        self.status_label.setStyleSheet("color: #ffaa00;")
+        self.apply_style(self.status_label, STYLE_ORANGE_LABEL)
     
     def show_failure(self, message):
         self.status_label.setText(message)
-        self.status_label.setStyleSheet("color: #ff0000;")
+        self.apply_style(self.status_label, STYLE_RED_LABEL)
         self.code_input.clear()
         
         # Re-enable input after 3 seconds using the timer created in __init__
@@ -304,57 +361,66 @@ class ServerRoomStation(QWidget):
         self.status_label.setText('')
         self.code_input.setFocus()
     
+    @pyqtSlot()
     def show_self_destruct(self):
         self.title_label.setText('⚠️ TRANSMISSION SHUT DOWN ⚠️')
-        self.title_label.setStyleSheet("color: #ff0000;")
+        self.apply_style(self.title_label, STYLE_RED_LABEL)
         self.instruction_label.setText('SELF-DESTRUCT SEQUENCE INITIATED!')
-        self.instruction_label.setStyleSheet("color: #ff0000;")
+        self.apply_style(self.instruction_label, STYLE_RED_LABEL)
         self.code_input.hide()
         self.submit_button.hide()
         self.status_label.setText('')
     
+    @pyqtSlot()
     def show_abort_button(self):
         self.status_label.setText('PRESS BUTTON TO ABORT\nI GET BY WITH A LITTLE HELP FROM MY FRIENDS')
-        self.status_label.setStyleSheet("color: #ffaa00;")
+        self.apply_style(self.status_label, STYLE_ORANGE_LABEL)
         self.abort_button.show()
     
     def press_abort_button(self):
         # Check if connected before pressing abort
         if not self.sio.connected:
             self.status_label.setText('ERROR: NOT CONNECTED TO SERVER')
-            self.status_label.setStyleSheet("color: #ff0000;")
+            self.apply_style(self.status_label, STYLE_RED_LABEL)
             return
         
-        print("Server room abort button pressed!")
+        logger.info("Server room abort button pressed!")
+        self.abort_button.setEnabled(False)
+        self.status_label.setText('BUTTON PRESSED!\nI GET BY WITH A LITTLE HELP FROM MY FRIENDS...')
+        asyncio.ensure_future(self.send_abort_press())
+    
+    async def send_abort_press(self):
         try:
-            self.sio.emit('abort_button_press', {'location': 'server_room'})
-            self.abort_button.setEnabled(False)
-            self.status_label.setText('BUTTON PRESSED!\nI GET BY WITH A LITTLE HELP FROM MY FRIENDS...')
+            await self.sio.emit('abort_button_press', {'location': 'server_room'})
         except Exception as e:
-            print(f"Error pressing abort button: {e}")
+            logger.error("Error pressing abort button: %s", e)
+            self.abort_button.setEnabled(True)
             self.status_label.setText('ERROR: CONNECTION LOST')
-            self.status_label.setStyleSheet("color: #ff0000;")
+            self.apply_style(self.status_label, STYLE_RED_LABEL)
     
+    @pyqtSlot()
     def show_success(self):
         self.title_label.setText('✓ MISSION COMPLETE ✓')
-        self.title_label.setStyleSheet("color: #00ff00;")
+        self.apply_style(self.title_label, STYLE_GREEN_LABEL)
         self.instruction_label.setText('SELF-DESTRUCT SEQUENCE ABORTED!')
-        self.instruction_label.setStyleSheet("color: #00ff00;")
+        self.apply_style(self.instruction_label, STYLE_GREEN_LABEL)
         self.status_label.setText('YOU HAVE BEATEN THE ESCAPE ROOM!  PLease press the exit button next to the door to leave')
-        self.status_label.setStyleSheet("color: #00ff00;")
+        self.apply_style(self.status_label, STYLE_GREEN_LABEL)
         self.abort_button.hide()
-        self.stop_sounds.set()
+        self.sounds_stopped = True
     
+    @pyqtSlot()
     def reset_abort_button(self):
         self.abort_button.setEnabled(True)
         self.status_label.setText('FAILED! TRY AGAIN\n(MUST BE WITHIN 10 SECONDS)')
-        self.status_label.setStyleSheet("color: #ff0000;")
+        self.apply_style(self.status_label, STYLE_RED_LABEL)
     
+    @pyqtSlot()
     def reset_station(self):
         self.title_label.setText('SERVER CONTROL TERMINAL')
-        self.title_label.setStyleSheet("color: #00ff00;")
+        self.apply_style(self.title_label, STYLE_GREEN_LABEL)
         self.instruction_label.setText('ENTER SHUTDOWN CODE:')
-        self.instruction_label.setStyleSheet("color: #00ff00;")
+        self.apply_style(self.instruction_label, STYLE_GREEN_LABEL)
         self.code_input.show()
         self.code_input.setEnabled(True)
         self.code_input.clear()
@@ -364,60 +430,96 @@ class ServerRoomStation(QWidget):
         self.abort_button.hide()
         self.abort_button.setEnabled(True)
     
+    def find_audio_file(self, clip_name):
+        """Return the path of a clip, or None if no supported file exists"""
+        return self.clip_paths.get(clip_name)
+    
+    def start_mixer(self):
+        """Start the pygame mixer (called once, under mixer_lock)"""
+        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=4096)
+        self.mixer_ready = True
+    
+    def load_sound(self, clip_name):
+        """Return the cached Sound for a preloaded clip, decoding it on first use"""
+        sound = self.sounds.get(clip_name)
+        if sound is None:
+            audio_file = self.find_audio_file(clip_name)
+            if not audio_file:
+                return None
+            sound = pygame.mixer.Sound(audio_file)
+            sound.set_volume(0.8)
+            sound = self.sounds.setdefault(clip_name, sound)
+        return sound
+    
+    def play_sound_async(self, clip_name):
+        """Load and play a clip on a worker thread so the GUI never waits on disk"""
+        self.audio_pool.start(QRunnable.create(lambda: self.play_sound(clip_name)))
+    
     def play_sound(self, clip_name):
         """Play audio clip"""
         try:
-            extensions = ['.mp3', '.wav', '.ogg']
-            audio_file = None
+            with self.mixer_lock:
+                if not self.mixer_ready:
+                    self.start_mixer()
             
-            for ext in extensions:
-                test_file = os.path.join(self.audio_path, f'{clip_name}{ext}')
-                if os.path.exists(test_file):
-                    audio_file = test_file
-                    break
+            sound = self.load_sound(clip_name) if clip_name in PRELOADED_CLIPS else None
+            if sound is not None:
+                sound.play()
+                logger.info("✓ Playing: %s", clip_name)
+                return
             
+            # Clips that were not preloaded are streamed
+            audio_file = self.find_audio_file(clip_name)
             if audio_file:
                 pygame.mixer.music.load(audio_file)
                 pygame.mixer.music.set_volume(0.8)
                 pygame.mixer.music.play()
-                print(f"✓ Playing: {clip_name}")
+                logger.info("✓ Playing: %s", clip_name)
             else:
-                print(f"✗ Audio file not found: {clip_name}")
+                logger.warning("✗ Audio file not found: %s", clip_name)
         except Exception as e:
-            print(f"Error playing audio: {e}")
+            logger.error("Error playing audio: %s", e)
     
     def start_random_sounds(self):
-        """Background thread for random creepy sounds"""
-        def random_sound_loop():
-            creepy_sounds = ['creepy1', 'creepy2', 'whisper', 'footsteps', 'door_creak']
-            while not self.stop_sounds.is_set():
-                # Wait random interval (30-120 seconds)
-                wait_time = random.randint(30, 120)
-                if self.stop_sounds.wait(wait_time):
-                    break
-                
-                # Play random creepy sound
-                sound = random.choice(creepy_sounds)
-                self.play_sound(sound)
-        
-        sound_thread = Thread(target=random_sound_loop, daemon=True)
-        sound_thread.start()
+        """Schedule random creepy sounds on the Qt loop"""
+        self.rng = random.Random()
+        self.schedule_creepy_sound()
+    
+    def schedule_creepy_sound(self):
+        if self.sounds_stopped:
+            return
+        # Wait random interval (30-120 seconds)
+        QTimer.singleShot(self.rng.randint(30, 120) * 1000, self.play_creepy_sound)
+    
+    def play_creepy_sound(self):
+        if self.sounds_stopped:
+            return
+        self.play_sound_async(self.rng.choice(self.CREEPY_SOUNDS))
+        self.schedule_creepy_sound()
     
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Escape:
             self.close()
     
     def closeEvent(self, event):
-        self.stop_sounds.set()
-        self.reconnect_timer.stop()
+        self.sounds_stopped = True
         if hasattr(self, 'sio'):
-            self.sio.disconnect()
-        pygame.mixer.quit()
+            asyncio.ensure_future(self.sio.disconnect())
+        # Drop queued clips and let running ones finish before the mixer goes away
+        self.audio_pool.clear()
+        self.audio_pool.waitForDone(1000)
+        with self.mixer_lock:
+            if self.mixer_ready:
+                pygame.mixer.quit()
+                self.mixer_ready = False
         event.accept()
 
 if __name__ == '__main__':
     SERVER_URL = 'http://10.0.0.167:5000'  # Update with DM's IP for production
     
     app = QApplication(sys.argv)
+    loop = qasync.QEventLoop(app)
+    asyncio.set_event_loop(loop)
     station = ServerRoomStation(SERVER_URL)
-    sys.exit(app.exec_())
\ No newline at end of file
+    with loop:
+        loop.run_forever()
\ No newline at end of file
@@ -1,26 +1,71 @@
 import sys
+import asyncio
+from threading import Thread, Lock
 import socketio
 from PyQt5.QtWidgets import QApplication, QLabel, QWidget, QVBoxLayout
-from PyQt5.QtCore import Qt, pyqtSignal, QObject
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QObject, QTimer
+from PyQt5.QtGui import QFont, QColor, QPalette
+
+# Timer label color buckets: indexes into TimerDisplay.palettes, also carried by TimerSignals.set_color
+COLOR_RED, COLOR_AMBER, COLOR_GREEN = range(3)
+
+# Every "MM:SS" label a 30-minute game can show, indexed by seconds remaining
+GAME_SECONDS = 1800
+TIME_STRINGS = [f"{t // 60:02d}:{t % 60:02d}" for t in range(GAME_SECONDS + 1)]
+
+# Status strings shared by every emit so the same objects cross the signal each time
+STATUS_READY = 'READY'
+STATUS_PAUSED = 'PAUSED'
+STATUS_GAME_ACTIVE = 'GAME ACTIVE'
+STATUS_CONNECTED = 'CONNECTED'
+STATUS_PRESS_EXIT = 'PRESS EXIT BUTTON'
+STATUS_CONNECTION_FAILED = 'CONNECTION FAILED'
+
+# Built on the first initUI (QFont needs a QApplication) and reused by later displays
+_BIG_FONT = None
+_STATUS_FONT = None
 
 class TimerSignals(QObject):
     update_timer = pyqtSignal(int)
     update_status = pyqtSignal(str)
+    set_color = pyqtSignal(int)  # COLOR_* index
+    time_pending = pyqtSignal()  # pending_time went from None to a value
 
 class TimerDisplay(QWidget):
     def __init__(self, server_url):
         super().__init__()
+        self.sio = None
         self.signals = TimerSignals()
-        self.signals.update_timer.connect(self.update_display)
-        self.signals.update_status.connect(self.update_status_display)
+        # Emitted only from the socketio thread, so always queue onto the GUI thread
+        self.signals.update_timer.connect(self.update_display, Qt.QueuedConnection)
+        self.signals.update_status.connect(self.update_status_display, Qt.QueuedConnection)
+        self.signals.set_color.connect(self.set_timer_color, Qt.QueuedConnection)
+        self.signals.time_pending.connect(self.arm_display_timer, Qt.QueuedConnection)
+        
+        self.pending_time = None
+        self.pending_lock = Lock()  # pending_time is written by the socketio thread
+        self.display_timer = QTimer(self)
+        self.display_timer.setInterval(100)
+        self.display_timer.setSingleShot(True)
+        self.display_timer.setTimerType(Qt.CoarseTimer)
+        self.display_timer.timeout.connect(self.flush_pending_time)
         
         self.initUI()
-        self.setup_socketio(server_url)
+        # Start networking after the first paint so 30:00 is on screen immediately
+        QTimer.singleShot(0, lambda: self.setup_socketio(server_url))
     
     def initUI(self):
+        global _BIG_FONT, _STATUS_FONT
+        if _BIG_FONT is None:
+            _BIG_FONT = QFont('Courier New', 200, QFont.Bold)
+            _STATUS_FONT = QFont('Courier New', 40)
+        
         self.setWindowTitle('Escape Room Timer')
-        self.setStyleSheet("background-color: black;")
+        # Black background via the palette so the window never goes through the stylesheet engine
+        pal = self.palette()
+        pal.setColor(QPalette.Window, Qt.black)
+        self.setPalette(pal)
+        self.setAutoFillBackground(True)
         self.showFullScreen()
         
         # Create layout
@@ -32,100 +77,178 @@ class TimerDisplay(QWidget):
         # Timer label
         self.timer_label = QLabel('30:00', self)
         self.timer_label.setAlignment(Qt.AlignCenter)
-        self.timer_label.setStyleSheet("""
-            color: #00ff00;
-            font-weight: bold;
-        """)
-        font = QFont('Courier New', 200, QFont.Bold)
-        self.timer_label.setFont(font)
+        # No stylesheet reaches the label; the window palette paints the black behind the digits
+        self.timer_label.setAttribute(Qt.WA_StyledBackground, False)
+        self.pal_red = self.make_palette(QColor('#ff0000'))
+        self.pal_amber = self.make_palette(QColor('#ffaa00'))
+        self.pal_green = self.make_palette(QColor('#00ff00'))
+        self.palettes = (self.pal_red, self.pal_amber, self.pal_green)
+        self.timer_label.setPalette(self.pal_green)
+        self.current_palette = self.pal_green
+        self.last_time_str = '30:00'
+        self.timer_label.setFont(_BIG_FONT)
         layout.addWidget(self.timer_label)
         
         # Status label
-        self.status_label = QLabel('READY', self)
+        self.status_label = QLabel(STATUS_READY, self)
+        self.last_status = STATUS_READY
         self.status_label.setAlignment(Qt.AlignCenter)
         self.status_label.setStyleSheet("color: #00ff00;")
-        status_font = QFont('Courier New', 40)
-        self.status_label.setFont(status_font)
+        self.status_label.setFont(_STATUS_FONT)
         layout.addWidget(self.status_label)
         
         self.setLayout(layout)
     
     def setup_socketio(self, server_url):
-        self.sio = socketio.Client(logger=False, engineio_logger=False,
+        # AsyncClient runs on its own asyncio loop in a daemon thread; the GUI only sees signals
+        self.sio = socketio.AsyncClient(logger=False, engineio_logger=False,
             reconnection=True, reconnection_attempts=0,
             reconnection_delay=1, reconnection_delay_max=5)
         
+        self.has_connected = False
+        
         @self.sio.event
-        def connect():
+        async def connect():
             print('Timer display connected')
-            self.signals.update_status.emit('CONNECTED')
+            self.has_connected = True
+            self.signals.update_status.emit(STATUS_CONNECTED)
         
         @self.sio.event
-        def disconnect():
-            print('Timer display disconnected')
+        async def connect_error(data):
+            print(f"Connection error: {data}")
+            # Only the boot-time attempts are shown; later drops keep the game status
+            if not self.has_connected:
+                self.signals.update_status.emit(STATUS_CONNECTION_FAILED)
         
-        @self.sio.on('timer_update')
-        def on_timer_update(data):
-            self.signals.update_timer.emit(data['time_remaining'])
-        
-        @self.sio.on('timer_started')
-        def on_timer_started(data):
-            self.signals.update_status.emit('GAME ACTIVE')
-            self.signals.update_timer.emit(data['time_remaining'])
-        
-        @self.sio.on('timer_paused')
-        def on_timer_paused(data):
-            self.signals.update_status.emit('PAUSED')
-        
-        @self.sio.on('timer_resumed')
-        def on_timer_resumed(data):
-            self.signals.update_status.emit('GAME ACTIVE')
-        
-        @self.sio.on('game_over')
-        def on_game_over(data):
-            self.signals.update_status.emit('PRESS EXIT BUTTON')
-            self.timer_label.setStyleSheet("color: #ff0000; font-weight: bold;")
-        
-        @self.sio.on('game_reset')
-        def on_game_reset(data):
-            self.signals.update_status.emit('READY')
-            self.signals.update_timer.emit(1800)
-            self.timer_label.setStyleSheet("color: #00ff00; font-weight: bold;")
+        @self.sio.event
+        async def disconnect():
+            print('Timer display disconnected')
         
-        @self.sio.on('timer_stopped')
-        def on_timer_stopped(data):
-            self.signals.update_status.emit('READY')
-            self.signals.update_timer.emit(1800)
-            self.timer_label.setStyleSheet("color: #00ff00; font-weight: bold;")
+        # One catch-all handler routes game events through a plain dict lookup
+        self.event_handlers = {
+            'timer_update': self.on_timer_update,
+            'timer_started': self.on_timer_started,
+            'timer_paused': self.on_timer_paused,
+            'timer_resumed': self.on_timer_resumed,
+            'game_over': self.on_game_over,
+            'game_reset': self.on_game_reset,
+            'timer_stopped': self.on_game_reset,
+            'self_destruct_aborted': self.on_aborted,
+        }
         
-        @self.sio.on('self_destruct_aborted')
-        def on_aborted(data):
-            self.signals.update_status.emit('PRESS EXIT BUTTON')
-            self.timer_label.setStyleSheet("color: #00ff00; font-weight: bold;")
+        @self.sio.on('*')
+        async def on_any_event(event, data):
+            handler = self.event_handlers.get(event)
+            if handler is not None:
+                handler(data)
         
+        self.sio_loop = None
+        self.sio_thread = Thread(target=asyncio.run, args=(self.run_socketio(server_url),), daemon=True)
+        self.sio_thread.start()
+    
+    async def run_socketio(self, server_url):
+        """Connect and keep the client alive on the socketio thread's event loop"""
+        self.sio_loop = asyncio.get_running_loop()
         try:
             print(f"Connecting to {server_url}...")
-            self.sio.connect(server_url, namespaces=['/'])
+            # retry=True keeps trying with socketio's backoff even if the server is down at boot
+            await self.sio.connect(server_url, namespaces=['/'], transports=['websocket'], retry=True)
             print("Connected successfully!")
         except Exception as e:
             print(f"Connection error: {e}")
-            self.signals.update_status.emit('CONNECTION FAILED')
+            self.signals.update_status.emit(STATUS_CONNECTION_FAILED)
+            return
+        await self.sio.wait()
+    
+    def on_timer_update(self, data):
+        # Picked up by the display_timer tick; bursts collapse to the latest value
+        with self.pending_lock:
+            was_idle = self.pending_time is None
+            self.pending_time = data['time_remaining']
+        if was_idle:
+            self.signals.time_pending.emit()
+    
+    def on_timer_started(self, data):
+        self.signals.update_status.emit(STATUS_GAME_ACTIVE)
+        with self.pending_lock:
+            self.pending_time = None
+        self.signals.update_timer.emit(data['time_remaining'])
+    
+    def on_timer_paused(self, data):
+        self.signals.update_status.emit(STATUS_PAUSED)
+    
+    def on_timer_resumed(self, data):
+        self.signals.update_status.emit(STATUS_GAME_ACTIVE)
+    
+    def on_game_over(self, data):
+        self.signals.update_status.emit(STATUS_PRESS_EXIT)
+        # Drop an unflushed tick so it cannot recolor the label after this
+        with self.pending_lock:
+            self.pending_time = None
+        self.signals.set_color.emit(COLOR_RED)
+    
+    def on_game_reset(self, data):
+        """Handles both game_reset and timer_stopped"""
+        self.signals.update_status.emit(STATUS_READY)
+        with self.pending_lock:
+            self.pending_time = None
+        self.signals.update_timer.emit(1800)
+        self.signals.set_color.emit(COLOR_GREEN)
+    
+    def on_aborted(self, data):
+        self.signals.update_status.emit(STATUS_PRESS_EXIT)
+        with self.pending_lock:
+            self.pending_time = None
+        self.signals.set_color.emit(COLOR_GREEN)
     
+    @pyqtSlot()
+    def arm_display_timer(self):
+        """Flush pending_time in 100ms unless a flush is already scheduled"""
+        if not self.display_timer.isActive():
+            self.display_timer.start()
+    
+    def flush_pending_time(self):
+        """Show the most recent timer_update, if one arrived since the last tick"""
+        with self.pending_lock:
+            time_remaining, self.pending_time = self.pending_time, None
+        if time_remaining is not None:
+            self.update_display(time_remaining)
+    
+    @pyqtSlot(int)
     def update_display(self, time_remaining):
-        minutes = time_remaining // 60
-        seconds = time_remaining % 60
-        time_str = f"{minutes:02d}:{seconds:02d}"
+        if 0 <= time_remaining <= GAME_SECONDS:
+            time_str = TIME_STRINGS[time_remaining]
+        else:
+            time_str = f"{time_remaining // 60:02d}:{time_remaining % 60:02d}"
+        if time_str == self.last_time_str:
+            return
+        self.last_time_str = time_str
         self.timer_label.setText(time_str)
         
-        # Change color based on time
-        if time_remaining <= 60:
-            self.timer_label.setStyleSheet("color: #ff0000; font-weight: bold;")
-        elif time_remaining <= 300:
-            self.timer_label.setStyleSheet("color: #ffaa00; font-weight: bold;")
-        else:
-            self.timer_label.setStyleSheet("color: #00ff00; font-weight: bold;")
+        # Change color based on time: red <= 60s < amber <= 300s < green
+        self.set_timer_palette(self.palettes[(time_remaining > 60) + (time_remaining > 300)])
+    
+    def make_palette(self, color):
+        pal = QPalette(self.timer_label.palette())
+        pal.setColor(QPalette.WindowText, color)
+        return pal
+    
+    @pyqtSlot(int)
+    def set_timer_color(self, color):
+        """Apply a COLOR_* bucket; socketio handlers reach this only through set_color"""
+        self.set_timer_palette(self.palettes[color])
+    
+    def set_timer_palette(self, pal):
+        """Recolor the timer label only if the palette differs from the current one"""
+        if pal is not self.current_palette:
+            self.timer_label.setPalette(pal)
+            self.current_palette = pal
     
+    @pyqtSlot(str)
     def update_status_display(self, status):
+        if status == self.last_status:
+            return
+        self.last_status = status
         self.status_label.setText(status)
     
     def keyPressEvent(self, event):
@@ -133,8 +256,10 @@ class TimerDisplay(QWidget):
             self.close()
     
     def closeEvent(self, event):
-        if hasattr(self, 'sio') and self.sio.connected:
-            self.sio.disconnect()
+        self.display_timer.stop()
+        # Hand the disconnect to the socketio loop so closing never waits on the network
+        if self.sio is not None and self.sio.connected and self.sio_loop is not None:
+            asyncio.run_coroutine_threadsafe(self.sio.disconnect(), self.sio_loop)
         event.accept()
 
 if __name__ == '__main__':